@@ -0,0 +1,76 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _gather_numpy(big, starts, lo, hi, out):
+    for k in range(len(starts)):
+        out[k] = big[starts[k]+lo : starts[k]+hi]
+
+
+def _gather_loops(big, starts, lo, hi, out):
+    # Explicit index loops; numba compiles these better than slicing.
+    n_features = big.shape[1]
+    for k in range(len(starts)):
+        start = starts[k] + lo
+        for t in range(hi - lo):
+            for f in range(n_features):
+                out[k, t, f] = big[start+t, f]
+
+
+if njit is not None:
+    _gather_compiled = njit(cache=True)(_gather_loops)
+else:
+    _gather_compiled = None
+
+# dtypes numba can compile the kernel for; others (e.g. float16) use numpy.
+_COMPILED_DTYPES = {
+    np.dtype(dtype) for dtype in [
+        np.bool_, np.int8, np.int16, np.int32, np.int64,
+        np.uint8, np.uint16, np.uint32, np.uint64,
+        np.float32, np.float64, np.complex64, np.complex128,
+    ]
+}
+
+
+def _gather(big, starts, lo, hi, out):
+    if (
+        _gather_compiled is not None
+        and big.dtype in _COMPILED_DTYPES
+        and out.dtype in _COMPILED_DTYPES
+    ):
+        _gather_compiled(big, starts, lo, hi, out)
+    else:
+        _gather_numpy(big, starts, lo, hi, out)
+
+
+def gather(big, starts, lo, hi, out=None):
+    # Copy the windows big[start+lo : start+hi] for all starts into
+    # out of shape (len(starts), hi-lo, big.shape[1]).
+    starts = np.asarray(starts, dtype=np.int64)
+    # The compiled kernel doesn't check bounds, so these checks must not be
+    # asserts, which are skipped under python -O.
+    if big.ndim != 2 or starts.ndim != 1 or hi < lo:
+        raise ValueError(
+            f'Invalid gather of [{lo}, {hi}) from an array of shape '
+            f'{big.shape} with starts of shape {starts.shape}.'
+        )
+    if np.any(starts + lo < 0) or np.any(starts + hi > len(big)):
+        raise IndexError(
+            f'Windows [start+{lo}, start+{hi}) are out of bounds for '
+            f'an array of length {len(big)}.'
+        )
+
+    shape = (len(starts), hi-lo, big.shape[1])
+    if out is None:
+        out = np.empty(shape, dtype=big.dtype)
+    elif out.shape != shape:
+        raise ValueError(
+            f'out has shape {out.shape}, but {shape} is required.'
+        )
+    _gather(big, starts, lo, hi, out)
+
+    return out
@@ -1,4 +1,7 @@
 import numpy as np
+import torch
+
+from .._fast import gather
 
 
 class RangeChunkSpec:
@@ -82,36 +85,111 @@ class ChunkExtractor:
         self._preprocess(df)
 
     def _preprocess(self, df):
+        # Casted columns and stacked arrays are cached, so a feature used by
+        # several specs (e.g. encoding and label targets) is converted once.
+        column_cache = {}
+        array_cache = {}
+
+        def get_column(name, dtype):
+            key = (name, dtype)
+            if key not in column_cache:
+                column_cache[key] = df[name].to_numpy(dtype=dtype, copy=False)
+            return column_cache[key]
+
         self.data = {}
         for spec in self.range_chunk_specs:
-            values = df[spec.names].astype(spec.dtype).values
-            if len(values.shape) == 1:
-                values = values[:, np.newaxis]
-            self.data[spec.tag] = values
+            names = spec.names
+            if isinstance(names, str):
+                names = [names]
+            dtype = np.dtype(spec.dtype)
+
+            key = (tuple(names), dtype)
+            if key not in array_cache:
+                columns = [get_column(name, dtype) for name in names]
+                if len(columns) == 1:
+                    values = columns[0][:, np.newaxis]
+                else:
+                    values = np.column_stack(columns)
+                # Slicing a tensor returns a view, so default_collate only
+                # has to torch.stack the chunks. torch.from_numpy() requires
+                # a writable array.
+                array_cache[key] = torch.from_numpy(
+                    np.require(values, requirements=['C', 'W'])
+                )
+            self.data[spec.tag] = array_cache[key]
+
+        # (tag, array, lo, hi) for each spec, so extract() doesn't have to
+        # look up arrays or build slices per call.
+        self._plan = [
+            (spec.tag, self.data[spec.tag], spec.range_[0], spec.range_[1])
+            for spec in self.range_chunk_specs
+        ]
 
     def extract(self, start_time_index, return_time_index=False):
         assert start_time_index + self.chunk_min_t >= 0
 
-        times = self.time_index_values[
-            start_time_index + self.chunk_min_t :
-            start_time_index + self.chunk_max_t
-        ]
-
+        # Chunks are cloned so that they don't hold the storage of the whole
+        # array. Otherwise sending a chunk from a DataLoader worker moves the
+        # whole array to shared memory, and specs that share an array could
+        # be modified through each other's chunks.
+        s = start_time_index
+        chunk_dict = {
+            tag: array[s+lo : s+hi].clone()
+            for tag, array, lo, hi in self._plan
+        }
+
+        # Time index information.
+        if return_time_index:
+            times = self.time_index_values
+            for tag, _, lo, hi in self._plan:
+                chunk_dict[f'{tag}.time_index'] = times[s+lo : s+hi]
+
+        return chunk_dict
+
+    def extract_batch(
+        self, start_time_indices, return_time_index=False, out=None
+    ):
+        starts = np.asarray(start_time_indices, dtype=np.int64)
+        if np.any(starts + self.chunk_min_t < 0) or np.any(
+            starts + self.chunk_max_t > len(self.time_index_values)
+        ):
+            raise IndexError('Chunks are out of bounds of the data.')
+
+        # Tensors are on CPU here, so .numpy() shares their memory. If out
+        # is given, chunks are written into its preallocated (e.g. pinned)
+        # tensors of shape (B, hi-lo, F) instead of new ones.
         chunk_dict = {}
-        for spec in self.range_chunk_specs:
-            array = self.data[spec.tag][
-                start_time_index + self.chunk_min_t :
-                start_time_index + self.chunk_max_t
-            ]
-
-            range_ = (
-                spec.range_[0] - self.chunk_min_t,
-                spec.range_[1] - self.chunk_min_t,
-            )
-
-            chunk_dict[spec.tag] = array[slice(*range_)]
-            # Time index information.
-            if return_time_index:
-                chunk_dict[f'{spec.tag}.time_index'] = times[slice(*range_)]
-
-        return chunk_dict
\ No newline at end of file
+        for tag, array, lo, hi in self._plan:
+            if out is None:
+                chunk_dict[tag] = torch.from_numpy(
+                    gather(array.numpy(), starts, lo, hi)
+                )
+            else:
+                buffer = out[tag]
+                # Not asserts: they guard writes of the compiled kernel and
+                # must also run under python -O.
+                chunk_shape = (hi - lo, array.shape[1])
+                if (
+                    buffer.shape[0] < len(starts)
+                    or tuple(buffer.shape[1:]) != chunk_shape
+                    or buffer.dtype != array.dtype
+                ):
+                    raise ValueError(
+                        f'out[{tag!r}] of shape {tuple(buffer.shape)} and '
+                        f'dtype {buffer.dtype} can\'t hold {len(starts)} '
+                        f'chunks of shape {chunk_shape} and dtype '
+                        f'{array.dtype}.'
+                    )
+                # Only the first len(starts) rows belong to this batch.
+                buffer = buffer[:len(starts)]
+                gather(array.numpy(), starts, lo, hi, buffer.numpy())
+                chunk_dict[tag] = buffer
+
+        # Time index information.
+        if return_time_index:
+            times = self.time_index_values
+            for tag, _, lo, hi in self._plan:
+                chunk_dict[f'{tag}.time_index'] = \
+                    times[starts[:, np.newaxis] + np.arange(lo, hi)]
+
+        return chunk_dict
@@ -1,3 +1,5 @@
+import numbers
+
 import numpy as np
 import pandas as pd
 from torch.utils.data import Dataset
@@ -16,7 +18,15 @@ class TimeSeriesDataset(Dataset):
         fit_feature_transformers=True,
         return_time_index=False,
     ):
-        self.df = df.copy()
+        # sort_values() returns a new frame, so the input is left untouched
+        # without an extra copy. Rows of each time series are contiguous
+        # and sorted by time.
+        self.df = df.sort_values(
+            by=['time_series_id', 'time_index'], kind='mergesort'
+        )
+        for length in [encoding_length, decoding_length]:
+            assert isinstance(length, numbers.Integral) \
+                and not isinstance(length, bool)
         self.encoding_length = encoding_length
         self.decoding_length = decoding_length
         # Make chunk_specs from encoding, decoding and label specs.
@@ -32,60 +42,104 @@ class TimeSeriesDataset(Dataset):
         self._preprocess()
 
     def _preprocess(self):
-        self.df.sort_values(by='time_index', inplace=True)
+        # Fail early if a spec splits features that share a transformer,
+        # instead of when its chunks are converted back to data frames.
+        for spec in self.range_chunk_specs:
+            self.feature_transformers.validate(spec.names)
+
         if self.fit_feature_transformers:
             self.feature_transformers.fit(self.df)
 
         self.scaled_df = self.feature_transformers.transform(self.df)
 
-        splitted_dfs = [
-            df for _, df in self.scaled_df.groupby('time_series_id')
-        ]
+        # Rows are sorted by (time_series_id, time_index), so each time
+        # series starts where the id changes.
+        ids = self.scaled_df['time_series_id'].values
+        series_starts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        series_starts = np.concatenate(([0], series_starts))
+        series_lengths = np.diff(np.append(series_starts, len(ids)))
+
+        # All time series are concatenated, so every tag is stored in one
+        # contiguous tensor and a dataset index maps directly to a row.
+        self.chunk_extractor = ChunkExtractor(
+            self.scaled_df, self.range_chunk_specs
+        )
 
-        self.chunk_extractors = [
-            ChunkExtractor(df, self.range_chunk_specs) for df in splitted_dfs
-        ]
+        self.min_start_time_index = \
+            max(0, -self.chunk_extractor.chunk_min_t)
 
+        # Valid starts s of a series satisfy
+        # min_start_time_index <= s <= length - chunk_max_t, so that no
+        # chunk reads rows of the next series in the shared buffer.
+        chunk_max_t = self.chunk_extractor.chunk_max_t
         self.lengths = [
-            len(df) - self.chunk_extractors[0].chunk_length
-            for df in splitted_dfs
+            max(0, int(length) - chunk_max_t - self.min_start_time_index + 1)
+            for length in series_lengths
         ]
 
-        self.min_start_time_index = \
-            max(0, -self.chunk_extractors[0].chunk_min_t)
+        self._global_start = np.concatenate([
+            np.arange(length) + start + self.min_start_time_index
+            for start, length in zip(series_starts, self.lengths)
+        ]).astype(np.int64)
+
+        series_ends = np.repeat(series_starts + series_lengths, self.lengths)
+        assert np.all(self._global_start + chunk_max_t <= series_ends)
 
     def __len__(self):
-        return sum(self.lengths)
+        return len(self._global_start)
 
     def __getitem__(self, i):
-        cumsum = np.cumsum([0] + self.lengths)
-        df_index = np.argmax(cumsum - i > 0) - 1
+        # A sequence of indices gives a whole batch, e.g. for
+        # DataLoader(dataset, sampler=BatchSampler(...), batch_size=None).
+        if np.ndim(i) > 0:
+            return self.get_batch(i)
+
+        chunk_dict = self.chunk_extractor.extract(
+            int(self._global_start[i]), self.return_time_index
+        )
 
-        chunk_extractor = self.chunk_extractors[df_index]
-        start_time_index = i - cumsum[df_index] + self.min_start_time_index
+        return chunk_dict
 
-        chunk_dict = chunk_extractor.extract(
-            start_time_index, self.return_time_index
+    def get_batch(self, indices, out=None):
+        chunk_dict = self.chunk_extractor.extract_batch(
+            self._global_start[np.asarray(indices)], self.return_time_index,
+            out=out,
         )
 
         return chunk_dict
 
     def convert_item_to_df(self, item):
         tag_to_names_dict = {
-            spec.tag: spec.names
+            spec.tag: [spec.names] if isinstance(spec.names, str)
+            else list(spec.names)
             for spec in self.range_chunk_specs
         }
-        output = {}
+        # Tags with the same feature names and dtype are stacked row-wise,
+        # so that inverse_transform is called once per group, not per tag.
+        tag_arrays_dict = {}
         for tag, values in item.items():
-            data = {}
-            names = tag_to_names_dict[tag]
-            for name, series in zip(names, values.T):
-                data[name] = series
-            df = pd.DataFrame(data=data)
+            names = tuple(tag_to_names_dict[tag])
+            array = np.asarray(values)
+            tag_arrays_dict.setdefault(
+                (names, array.dtype), []
+            ).append((tag, array))
+
+        output = {}
+        for (names, _), tag_arrays in tag_arrays_dict.items():
+            df = pd.DataFrame(
+                np.concatenate([array for _, array in tag_arrays]),
+                columns=list(names),
+            )
             df = self.feature_transformers.inverse_transform(df)
-            output[tag] = df
 
-        return output
+            start = 0
+            for tag, array in tag_arrays:
+                end = start + len(array)
+                output[tag] = df.iloc[start:end].reset_index(drop=True)
+                start = end
+
+        # Keep the tag order of the item.
+        return {tag: output[tag] for tag in item}
 
     def plot_chunks(self):
         plot_chunks(
@@ -44,20 +44,26 @@ class CategoryMapper:
 
 class FeatureTransformers:
     def __init__(self, transformer_dict):
-        self.transformer_dict = transformer_dict
+        # A key is either a feature name or a tuple of feature names. The
+        # transformer of a tuple key is applied to all of its features at
+        # once with a (N, len(names)) array, e.g. a single StandardScaler
+        # for many columns.
+        names = [
+            name for key in transformer_dict
+            for name in (key if isinstance(key, tuple) else (key,))
+        ]
+        assert len(names) == len(set(names)), \
+            'A feature is assigned to more than one transformer.'
 
-    def _apply_to_single_feature(self, series, func):
-        values = series.values.reshape(-1, 1)
-        return_value = func(values)
-        if isinstance(return_value, np.ndarray):
-            return return_value.reshape(-1)
-        else:
-            return return_value
+        self.transformer_dict = transformer_dict
+        # Maps a tuple of column names to its valid names and groups.
+        self._valid_keys_cache = {}
 
-    def _append_index_and_id(self, data, df):
-        for name in ['time_index', 'time_series_id']:
-            if name in df.columns:
-                data[name] = df[name]
+    def _get_index_and_id_names(self, df):
+        return [
+            name for name in ['time_index', 'time_series_id']
+            if name in df.columns
+        ]
 
     def _get_valid_names(self, names):
         valid_name_set = set(self.transformer_dict.keys()) & set(names)
@@ -65,46 +71,96 @@ class FeatureTransformers:
             name for name in names if name in valid_name_set
         ]
 
-    def fit(self, df):
-        for name in self._get_valid_names(df.columns):
+    def _get_valid_groups(self, names):
+        name_set = set(names)
+        groups = [
+            key for key in self.transformer_dict.keys()
+            if isinstance(key, tuple) and not name_set.isdisjoint(key)
+        ]
+        # A transformer of a group can't be applied to part of its features.
+        for key in groups:
+            if not name_set.issuperset(key):
+                raise ValueError(
+                    f'Features {key} share a transformer but only '
+                    f'{[name for name in key if name in name_set]} '
+                    'are given.'
+                )
+
+        return groups
+
+    def _get_valid_keys(self, columns):
+        columns = tuple(columns)
+        if columns not in self._valid_keys_cache:
+            self._valid_keys_cache[columns] = (
+                self._get_valid_names(columns),
+                self._get_valid_groups(columns),
+            )
+        return self._valid_keys_cache[columns]
+
+    def validate(self, names):
+        # Raises ValueError if names contain only part of the features that
+        # share a transformer.
+        if isinstance(names, str):
+            names = [names]
+        self._get_valid_keys(names)
+
+    def _get_output_names(self, columns):
+        valid_names, valid_groups = self._get_valid_keys(columns)
+        name_set = set(valid_names)
+        for names in valid_groups:
+            name_set.update(names)
+        # Transformed features keep the order of the input columns.
+        return [name for name in columns if name in name_set]
+
+    def _apply(self, df, method):
+        # Outputs are kept as 1D columns and the frame is built once in
+        # output order. Stacking them into row-major 2D blocks first costs
+        # a transpose in pandas plus a reindex.
+        columns = {}
+
+        valid_names, valid_groups = self._get_valid_keys(df.columns)
+        for name in valid_names:
             transformer = self.transformer_dict[name]
 
-            self._apply_to_single_feature(
-                df[name], transformer.fit
+            # Transformers take (N, 1) arrays and may return (N, 1) or (N,).
+            values = getattr(transformer, method)(
+                df[name].to_numpy()[:, np.newaxis]
             )
+            columns[name] = np.asarray(values).reshape(len(df))
 
-    def transform(self, df):
-        data = {}
-        for name in self._get_valid_names(df.columns):
-            transformer = self.transformer_dict[name]
+        for names in valid_groups:
+            transformer = self.transformer_dict[names]
 
-            data[name] = self._apply_to_single_feature(
-                df[name], transformer.transform
-            )
+            values = getattr(transformer, method)(df[list(names)].values)
+            for name, column in zip(names, np.asarray(values).T):
+                columns[name] = column
+
+        data = {
+            name: columns[name]
+            for name in self._get_output_names(df.columns)
+        }
+        for name in self._get_index_and_id_names(df):
+            data[name] = df[name]
 
-        self._append_index_and_id(data, df)
         return pd.DataFrame(data=data, index=df.index)
 
-    def fit_transform(self, df):
-        data = {}
-        for name in self._get_valid_names(df.columns):
+    def fit(self, df):
+        valid_names, valid_groups = self._get_valid_keys(df.columns)
+        for name in valid_names:
             transformer = self.transformer_dict[name]
 
-            data[name] = self._apply_to_single_feature(
-                df[name], transformer.fit_transform
-            )
+            transformer.fit(df[name].to_numpy()[:, np.newaxis])
 
-        self._append_index_and_id(data, df)
-        return pd.DataFrame(data=data, index=df.index)
+        for names in valid_groups:
+            transformer = self.transformer_dict[names]
 
-    def inverse_transform(self, df):
-        data = {}
-        for name in self._get_valid_names(df.columns):
-            transformer = self.transformer_dict[name]
+            transformer.fit(df[list(names)].values)
 
-            data[name] = self._apply_to_single_feature(
-                df[name], transformer.inverse_transform
-            )
+    def transform(self, df):
+        return self._apply(df, 'transform')
 
-        self._append_index_and_id(data, df)
-        return pd.DataFrame(data=data, index=df.index)
\ No newline at end of file
+    def fit_transform(self, df):
+        return self._apply(df, 'fit_transform')
+
+    def inverse_transform(self, df):
+        return self._apply(df, 'inverse_transform')
@@ -1,15 +1,33 @@
+import os
 from abc import ABC, abstractmethod
 
 import torch
 import torch.nn as nn
 import pytorch_lightning as pl
 
-from ..util import merge_dicts
-
 
 class ForecastingModule(pl.LightningModule, ABC):
     def __init__(self):
         super().__init__()
+        # Dynamo caches one graph per value of self.training, so switching
+        # between training and evaluation doesn't trigger recompilation.
+        if os.environ.get('DEEP_TIME_SERIES_COMPILE', '0') == '1':
+            self.compile(dynamic=True)
+
+    def __getstate__(self):
+        # The compiled call can't be pickled, so it is dropped here and
+        # compiled again in __setstate__.
+        state = super().__getstate__()
+        state['_recompile'] = \
+            state.pop('_compiled_call_impl', None) is not None
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        recompile = state.pop('_recompile', False)
+        super().__setstate__(state)
+        if recompile:
+            self.compile(dynamic=True)
 
     @abstractmethod
     def encode(self, inputs):
@@ -49,9 +67,9 @@ class ForecastingModule(pl.LightningModule, ABC):
 
     def forward(self, inputs):
         encoder_outputs = self.encode(inputs)
-        decoder_inputs = merge_dicts(
-            [inputs, encoder_outputs]
-        )
+        assert inputs.keys().isdisjoint(encoder_outputs.keys()), \
+            'Keys of dictionaries are duplicated.'
+        decoder_inputs = {**inputs, **encoder_outputs}
         outputs = self.decode(decoder_inputs)
 
         return outputs
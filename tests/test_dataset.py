@@ -0,0 +1,203 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+from deep_time_series.data import (
+    EncodingChunkSpec,
+    DecodingChunkSpec,
+    LabelChunkSpec,
+    FeatureTransformers,
+    TimeSeriesDataset,
+)
+
+
+def make_dataset(length=20, shift=3, encoding_length=2):
+    df = pd.concat([
+        pd.DataFrame({
+            'time_index': np.arange(length),
+            'time_series_id': i,
+            'y': np.arange(length) + 100.0 * i,
+        })
+        for i in range(2)
+    ])
+
+    return TimeSeriesDataset(
+        df,
+        encoding_length=encoding_length,
+        decoding_length=2,
+        chunk_specs=[
+            EncodingChunkSpec('y', ['y'], np.float32, shift=shift),
+            LabelChunkSpec('y', ['y'], np.float32, shift=shift),
+        ],
+        feature_transformers=FeatureTransformers({
+            'y': FunctionTransformer(),
+        }),
+    )
+
+
+def test_chunks_stay_inside_their_time_series():
+    ds = make_dataset()
+
+    # Starts 0..13 per series, last label ends at row 19.
+    assert len(ds) == 2 * 14
+    for i in range(len(ds)):
+        item = ds[i]
+        values = np.concatenate([
+            item['encoding.y'].numpy().ravel(),
+            item['label.y'].numpy().ravel(),
+        ])
+        assert len(set(values // 100)) == 1
+
+    np.testing.assert_array_equal(ds[13]['label.y'].numpy().ravel(), [18, 19])
+    np.testing.assert_array_equal(
+        ds[27]['label.y'].numpy().ravel(), [118, 119]
+    )
+
+
+def test_window_count_without_shift():
+    ds = make_dataset(shift=0)
+
+    # Starts 0..16 per series, the last label ends at row 19.
+    assert len(ds) == 2 * 17
+    np.testing.assert_array_equal(ds[16]['label.y'].numpy().ravel(), [18, 19])
+    np.testing.assert_array_equal(
+        ds[17]['label.y'].numpy().ravel(), [102, 103]
+    )
+
+
+def test_get_batch_matches_items():
+    ds = make_dataset()
+
+    batch = ds.get_batch(np.arange(len(ds)))
+    for tag in ['encoding.y', 'label.y']:
+        expected = np.stack([ds[i][tag].numpy() for i in range(len(ds))])
+        np.testing.assert_array_equal(batch[tag].numpy(), expected)
+
+
+def test_get_batch_rejects_out_of_range_starts():
+    ds = make_dataset()
+    start = ds._global_start[-1] + 1
+
+    with pytest.raises(IndexError):
+        ds.chunk_extractor.extract_batch([start])
+
+
+def test_get_batch_writes_into_out():
+    ds = make_dataset()
+    out = {
+        tag: torch.full((4, 2, 1), -999.0)
+        for tag in ['encoding.y', 'label.y']
+    }
+
+    batch = ds.get_batch([0, 1], out=out)
+    expected = ds.get_batch([0, 1])
+    for tag in out:
+        assert batch[tag].shape == (2, 2, 1)
+        assert batch[tag].data_ptr() == out[tag].data_ptr()
+        np.testing.assert_array_equal(
+            batch[tag].numpy(), expected[tag].numpy()
+        )
+
+    with pytest.raises(ValueError):
+        ds.get_batch([0, 1, 2, 3, 4], out=out)
+    with pytest.raises(ValueError):
+        ds.get_batch([0, 1], out={
+            tag: torch.zeros((4, 3, 1)) for tag in out
+        })
+    with pytest.raises(ValueError):
+        ds.get_batch([0, 1], out={
+            tag: torch.zeros((4, 2, 1), dtype=torch.float64) for tag in out
+        })
+
+
+def test_spec_splitting_a_feature_group_is_rejected():
+    df = pd.DataFrame({
+        'time_index': np.arange(10),
+        'time_series_id': 0,
+        'a': np.arange(10.0),
+        'b': np.arange(10.0),
+    })
+
+    with pytest.raises(ValueError):
+        TimeSeriesDataset(
+            df,
+            encoding_length=2,
+            decoding_length=2,
+            chunk_specs=[
+                EncodingChunkSpec('x', ['a', 'b'], np.float32),
+                LabelChunkSpec('y', ['a'], np.float32),
+            ],
+            feature_transformers=FeatureTransformers({
+                ('a', 'b'): StandardScaler(),
+            }),
+        )
+
+
+def test_lengths_must_be_integers():
+    ds = make_dataset(encoding_length=np.int64(2))
+    assert len(ds) == 2 * 14
+
+    for encoding_length in [2.0, True]:
+        with pytest.raises(AssertionError):
+            make_dataset(encoding_length=encoding_length)
+
+
+def test_convert_item_to_df_restores_rows():
+    rng = np.random.default_rng(0)
+    df = pd.concat([
+        pd.DataFrame({
+            'time_index': np.arange(15),
+            'time_series_id': i,
+            'a': rng.normal(size=15),
+            'b': rng.normal(size=15),
+            'temp': rng.normal(size=15),
+        })
+        for i in range(2)
+    ])
+    # encoding.x and label.x share names but differ in length and dtype,
+    # and 'temp' is given as a single name.
+    ds = TimeSeriesDataset(
+        df,
+        encoding_length=4,
+        decoding_length=2,
+        chunk_specs=[
+            EncodingChunkSpec('x', ['a', 'b'], np.float32),
+            EncodingChunkSpec('temp', 'temp', np.float64),
+            DecodingChunkSpec('x', ['a', 'b'], np.float64),
+            LabelChunkSpec('x', ['a', 'b'], np.float64),
+        ],
+        feature_transformers=FeatureTransformers({
+            'a': StandardScaler(),
+            'b': StandardScaler(),
+            'temp': StandardScaler(),
+        }),
+    )
+
+    ranges = {spec.tag: spec.range_ for spec in ds.range_chunk_specs}
+    for i in [0, 7, len(ds) - 1]:
+        output = ds.convert_item_to_df(ds[i])
+        assert list(output) == list(ds[i])
+
+        start = ds._global_start[i]
+        for tag, (lo, hi) in ranges.items():
+            names = ['temp'] if tag == 'encoding.temp' else ['a', 'b']
+            expected = ds.df[names].iloc[start+lo : start+hi]
+            assert (output[tag].dtypes == ds[i][tag].numpy().dtype).all()
+            np.testing.assert_allclose(
+                output[tag][names].to_numpy(), expected.to_numpy(),
+                rtol=1e-5,
+            )
+
+
+def test_getitem_accepts_scalar_and_sequence_indices():
+    ds = make_dataset()
+    expected = ds[3]['label.y']
+
+    for i in [np.int64(3), np.array(3), torch.tensor(3)]:
+        assert torch.equal(ds[i]['label.y'], expected)
+    for indices in [[3, 4], np.array([3, 4]), torch.tensor([3, 4])]:
+        batch = ds[indices]['label.y']
+        assert batch.shape == (2, 2, 1)
+        assert torch.equal(batch[0], expected)
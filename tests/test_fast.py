@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from deep_time_series import _fast
+from deep_time_series._fast import gather
+
+
+@pytest.mark.parametrize('dtype', [np.float16, np.float32, np.int64])
+@pytest.mark.parametrize('compiled', [True, False])
+def test_gather_copies_windows(monkeypatch, dtype, compiled):
+    # Without numba (or with compiled=False) the numpy fallback is used.
+    if not compiled:
+        monkeypatch.setattr(_fast, '_gather_compiled', None)
+    big = np.arange(20).reshape(10, 2).astype(dtype)
+
+    out = gather(big, [0, 3, 8], 0, 2)
+    assert out.dtype == dtype
+    np.testing.assert_array_equal(out, np.stack([
+        big[0:2], big[3:5], big[8:10],
+    ]))
+
+
+def test_gather_checks_bounds_and_out_shape():
+    big = np.arange(20.0).reshape(10, 2)
+
+    with pytest.raises(IndexError):
+        gather(big, [50], 0, 2)
+    with pytest.raises(IndexError):
+        gather(big, [0], -1, 2)
+    with pytest.raises(ValueError):
+        gather(big, [0, 1, 2, 3], 0, 2, out=np.zeros((1, 2, 2)))
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from deep_time_series.data import FeatureTransformers
+from deep_time_series.data.transform import CategoryMapper
+
+
+def test_output_keeps_input_column_order():
+    df = pd.DataFrame({
+        'a': np.arange(5.0),
+        'time_index': np.arange(5),
+        'c': [1, 2, 1, 2, 1],
+        'b': np.arange(5.0) ** 2,
+    })
+    feature_transformers = FeatureTransformers({
+        'a': StandardScaler(),
+        'b': StandardScaler(),
+        'c': CategoryMapper(),
+    })
+
+    scaled_df = feature_transformers.fit_transform(df)
+    assert list(scaled_df.columns) == ['a', 'c', 'b', 'time_index']
+
+    restored_df = feature_transformers.inverse_transform(scaled_df)
+    assert list(restored_df.columns) == ['a', 'c', 'b', 'time_index']
+    pd.testing.assert_frame_equal(restored_df, df[restored_df.columns])
+
+
+def test_group_shares_one_transformer():
+    df = pd.DataFrame({
+        'a': np.arange(6.0),
+        'b': np.arange(6.0) ** 2,
+        'time_index': np.arange(6),
+    })
+    scaler = StandardScaler()
+    feature_transformers = FeatureTransformers({('a', 'b'): scaler})
+
+    scaled_df = feature_transformers.fit_transform(df)
+    assert scaler.n_features_in_ == 2
+    np.testing.assert_allclose(scaler.mean_, df[['a', 'b']].mean())
+
+    values = df[['a', 'b']].to_numpy()
+    expected = (values - values.mean(axis=0)) / values.std(axis=0)
+    np.testing.assert_allclose(scaled_df[['a', 'b']].to_numpy(), expected)
+    pd.testing.assert_frame_equal(
+        feature_transformers.transform(df), scaled_df
+    )
+
+    restored_df = feature_transformers.inverse_transform(scaled_df)
+    pd.testing.assert_frame_equal(restored_df, df)
+
+
+def test_validate_rejects_part_of_a_group():
+    feature_transformers = FeatureTransformers({
+        ('a', 'b'): StandardScaler(),
+        'c': StandardScaler(),
+    })
+
+    feature_transformers.validate(['a', 'b', 'c'])
+    feature_transformers.validate('c')
+    with pytest.raises(ValueError):
+        feature_transformers.validate(['a', 'c'])
+    with pytest.raises(ValueError):
+        feature_transformers.inverse_transform(pd.DataFrame({'b': [1.0]}))